@@ -4,7 +4,7 @@ import json
 from bs4 import BeautifulSoup
 from typing import List, Dict, Optional, Any, Union
 from bs4 import Tag
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, asdict, field, fields
 import time
 import logging
 from datetime import datetime
@@ -12,9 +12,23 @@ import ddddocr
 import onnxruntime
 import os
 import gc
+try:
+    import orjson  # Fast encoder for subject exports and progress saves (same output as json.dump with indent=2, ensure_ascii=False)
+except ImportError:
+    orjson = None
 from data_utils import html_to_clean_markdown, utc_now_iso, clean_html_text, parse_enrollment_status_from_image, clean_class_attributes, format_duration_human, calculate_duration_seconds
 
 
+def write_json_file(filename: str, data: Any) -> None:
+    """Write data as 2-space indented UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
 @dataclass
 class ScrapingConfig:
     """Configuration for testing vs production scraping"""
@@ -98,13 +112,17 @@ class Course:
     recommended_readings: str = ""   # Recommended reading materials
     
     def to_dict(self) -> Dict:
-        data = asdict(self)
-        # Remove postback_target from exported data
-        data.pop('postback_target', None)
+        # Build from the precomputed field list (postback_target excluded) instead of asdict(),
+        # which would deep-copy every term only for them to be converted again below
+        data = {name: getattr(self, name) for name in COURSE_EXPORT_FIELDS}
         # Convert terms to dict format
         data['terms'] = [term.to_dict() for term in self.terms]
+        data['assessment_types'] = dict(self.assessment_types)
         return data
 
+# Course fields included in exported data, in declaration order
+COURSE_EXPORT_FIELDS = tuple(f.name for f in fields(Course) if f.name != 'postback_target')
+
 class ScrapingProgressTracker:
     """Tracks scraping progress for production runs with resume capability"""
     
@@ -161,8 +179,7 @@ class ScrapingProgressTracker:
                 if duration_seconds is not None:
                     self.progress_data["scraping_log"]["duration_human"] = format_duration_human(duration_seconds)
             
-            with open(self.progress_file, 'w', encoding='utf-8') as f:
-                json.dump(self.progress_data, f, ensure_ascii=False, indent=2)
+            write_json_file(self.progress_file, self.progress_data)
             
             self.logger.debug(f"💾 Progress saved to {self.progress_file}")
         except Exception as e:
@@ -1731,8 +1748,7 @@ class CuhkScraper:
             # Save to simple filename (no timestamp suffix for better git diffs)
             filename = f"{config.output_directory}/{subject}.json"
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(subject_data, f, ensure_ascii=False, indent=2)
+            write_json_file(filename, subject_data)
             
             self.logger.info(f"💾 SAVED {subject} → {filename}")
             return filename
@@ -1761,8 +1777,7 @@ class CuhkScraper:
             # Create filename with subject prefix
             filename = f"{config.output_directory}/{subject}_{timestamp}.json"
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(subject_data, f, ensure_ascii=False, indent=2)
+            write_json_file(filename, subject_data)
             
             exported_files.append(filename)
             self.logger.info(f"Exported {subject} ({len(courses)} courses) to {filename}")
@@ -146,6 +146,16 @@ def normalize_markdown_whitespace(text: str) -> str:
     return text.strip()
 
 
+# Empty header row (only pipes and whitespace), a '---' separator line, then a
+# line starting with '|' - the same three-line window fix_table_headers scans for
+EMPTY_TABLE_HEADER_PATTERN = re.compile(
+    r'^(?P<header>[^\S\n]*\|(?:[^\S\n]|\|)*)\n'
+    r'(?P<separator>[^\n]*---[^\n]*)\n'
+    r'(?P<row>[^\S\n]*\|[^\n]*)',
+    re.MULTILINE,
+)
+
+
 def fix_table_headers(markdown_text: str) -> str:
     """
     Fix empty header rows in markdown tables.
@@ -164,32 +174,10 @@ def fix_table_headers(markdown_text: str) -> str:
     if not markdown_text:
         return ""
     
-    lines = markdown_text.split('\n')
-    result = []
-    
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        
-        # Detect empty header pattern: |  |  |
-        if line.strip().startswith('|') and line.strip().endswith('|'):
-            # Split by | and check if all cells are empty (ignoring first/last empty splits)
-            cells = line.split('|')[1:-1]  # Remove first and last empty elements
-            if all(cell.strip() == '' for cell in cells):
-                # Check if next line is separator: | --- | --- |
-                if i + 1 < len(lines) and '---' in lines[i + 1]:
-                    # Check if line after separator has content
-                    if i + 2 < len(lines) and lines[i + 2].strip().startswith('|'):
-                        # Replace empty header with first data row
-                        result.append(lines[i + 2])  # Use first data row as header
-                        result.append(lines[i + 1])  # Keep separator
-                        i += 3  # Skip empty header, separator, and used data row
-                        continue
-        
-        result.append(line)
-        i += 1
-    
-    return '\n'.join(result)
+    # Swap each empty header + separator + first data row for data row + separator
+    return EMPTY_TABLE_HEADER_PATTERN.sub(
+        lambda match: f"{match['row']}\n{match['separator']}", markdown_text
+    )
 
 
 def html_to_plain_text(html_content: str) -> str:
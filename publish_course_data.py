@@ -7,20 +7,63 @@ Validates and publishes course JSON files from /data to /web/public/data for dep
 - Checks against scraping_progress.json
 - Reports total scraping time and statistics
 - Saves console output to file
-- Preserves original files in /data
+- Preserves original files in /data (unless --move is given)
 
-Usage: python publish_course_data.py [--dry-run]
+Usage: python publish_course_data.py [--dry-run] [--move] [--no-validate]
 """
 
+import io
 import json
+import mmap
 import os
 import re
 import shutil
-import glob
 import sys
 from datetime import datetime
+from itertools import islice
+from operator import itemgetter
 from zoneinfo import ZoneInfo
 from typing import Dict, List, Tuple, Optional
+try:
+    from orjson import loads as json_loads  # Parses bytes directly, several times faster than json
+    JSON_LOADS_ACCEPTS_BUFFERS = True  # orjson can parse a memoryview (e.g. over an mmap) without copying
+except ImportError:
+    try:
+        from ujson import loads as json_loads  # C parser, still faster than json (accepts bytes, not buffers)
+    except ImportError:
+        from json import loads as json_loads  # Stdlib fallback (also accepts UTF-8 bytes)
+    JSON_LOADS_ACCEPTS_BUFFERS = False
+
+# Validation results from previous runs, reused for unchanged course files
+VALIDATION_CACHE_FILE = "logs/publish/validation_cache.json"
+
+# Course files are named after their 4-letter uppercase subject code, e.g. CSCI.json
+SUBJECT_FILE_PATTERN = re.compile(r'[A-Z]{4}\.json')
+
+# ALL_SUBJECTS array in CourseSearch.tsx and the quoted subject codes inside it
+ALL_SUBJECTS_PATTERN = re.compile(r'const ALL_SUBJECTS = \[([\s\S]*?)\]')
+QUOTED_SUBJECT_PATTERN = re.compile(r"'([A-Z]{4})'")
+
+# Fields every course entry must have (checked on the first few courses of each file)
+REQUIRED_COURSE_FIELDS = ('subject', 'course_code', 'title', 'credits')
+
+# Bump whenever check_course_file's checks change - a cache written under other rules is discarded
+VALIDATION_CACHE_VERSION = 2
+VALIDATION_RULES = f"{VALIDATION_CACHE_VERSION}:{','.join(REQUIRED_COURSE_FIELDS)}"
+
+# Issue reported for subjects whose file has no courses
+NO_COURSES_ISSUE = "No courses found in file"
+
+def load_json_file(file_path: str):
+    """
+    Parse a JSON file. With orjson the file is memory-mapped and parsed in place,
+    avoiding a full-size copy into a bytes object; otherwise it is read normally.
+    """
+    with open(file_path, 'rb') as f:
+        if JSON_LOADS_ACCEPTS_BUFFERS and os.fstat(f.fileno()).st_size > 0:  # Empty files can't be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                return json_loads(view)
+        return json_loads(f.read())
 
 def load_scraping_progress() -> Optional[Dict]:
     """Load scraping progress data for validation"""
@@ -30,35 +73,108 @@ def load_scraping_progress() -> Optional[Dict]:
         return None
 
     try:
-        with open(progress_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(progress_file, 'rb') as f:
+            return json_loads(f.read())
     except Exception as e:
         print(f"❌ Error reading scraping_progress.json: {e}")
         return None
 
-def validate_course_file(file_path: str, subject_code: str, progress_data: Optional[Dict]) -> Tuple[bool, List[str]]:
+def load_validation_cache() -> Dict:
+    """
+    Load cached validation results from previous runs
+    Returns an empty cache if the file was written under different validation rules
+    """
+    if not os.path.exists(VALIDATION_CACHE_FILE):
+        return {}
+
+    try:
+        with open(VALIDATION_CACHE_FILE, 'rb') as f:
+            data = json_loads(f.read())
+    except Exception:
+        return {}  # Corrupt cache - just revalidate everything
+
+    if not isinstance(data, dict) or data.get('rules') != VALIDATION_RULES:
+        return {}  # Stale rules (or pre-versioning format) - revalidate everything
+    return data.get('files', {})
+
+def save_validation_cache(cache: Dict, file_paths: List[str]) -> None:
+    """
+    Persist validation results so unchanged files can be skipped next run
+    Only entries for file_paths are kept, so files that were moved or deleted drop out
+    """
+    files = {file_path: cache[file_path] for file_path in file_paths if file_path in cache}
+    try:
+        os.makedirs(os.path.dirname(VALIDATION_CACHE_FILE), exist_ok=True)
+        with open(VALIDATION_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'rules': VALIDATION_RULES, 'files': files}, f)
+    except Exception as e:
+        print(f"⚠️ Warning: Could not save validation cache: {e}")
+
+def get_validation_cache_key(file_path: str, subject_progress: Optional[Dict]) -> Optional[str]:
+    """
+    Build the cache key for a course file: file mtime + size, plus the
+    progress fields that validation compares against
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+
+    subject_progress = subject_progress or {}
+    return (f"{stat.st_mtime_ns}:{stat.st_size}:{subject_progress.get('status')}:"
+            f"{subject_progress.get('courses_count')}:{subject_progress.get('courses_scraped')}")
+
+def validate_course_file(file_path: str, subject_code: str, subject_progress: Optional[Dict],
+                         cache: Optional[Dict] = None) -> Tuple[bool, List[str], bool]:
+    """
+    Validate a course JSON file, reusing the cached result if the file is unchanged
+    subject_progress is this subject's entry from scraping_progress.json (None if unavailable)
+    Returns (is_valid, list_of_issues, is_empty) - is_empty is set when the file has no courses
+    """
+    cache_key = get_validation_cache_key(file_path, subject_progress) if cache is not None else None
+    if cache_key:
+        cached = cache.get(file_path)
+        if cached and cached.get('key') == cache_key:
+            return cached['is_valid'], cached['issues'], cached['is_empty']
+
+    is_valid, issues, is_empty = check_course_file(file_path, subject_code, subject_progress)
+
+    if cache_key:
+        cache[file_path] = {'key': cache_key, 'is_valid': is_valid, 'issues': issues, 'is_empty': is_empty}
+
+    return is_valid, issues, is_empty
+
+def check_course_file(file_path: str, subject_code: str, subject_progress: Optional[Dict]) -> Tuple[bool, List[str], bool]:
     """
-    Validate a course JSON file
-    Returns (is_valid, list_of_issues)
+    Validate a course JSON file (always parses the file)
+    Returns (is_valid, list_of_issues, is_empty)
     """
     issues = []
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_file(file_path)
     except Exception as e:
-        return False, [f"Failed to parse JSON: {e}"]
+        return False, [f"Failed to parse JSON: {e}"], False
     
-    # Check basic structure
+    # Check basic structure (bail out early on anything the checks below can't handle)
+    if not isinstance(data, dict):
+        return False, ["Top-level JSON is not an object"], False
     if 'metadata' not in data:
         issues.append("Missing 'metadata' section")
     if 'courses' not in data:
         issues.append("Missing 'courses' section")
-        return False, issues  # Can't continue without courses
+        return False, issues, False  # Can't continue without courses
     
     courses = data.get('courses', [])
     metadata = data.get('metadata', {})
     
+    if not isinstance(courses, list):
+        issues.append("'courses' section is not a list")
+        return False, issues, False
+    if not isinstance(metadata, dict):
+        issues.append("'metadata' section is not an object")
+        metadata = {}
+    
     # Check metadata
     if metadata.get('subject') != subject_code:
         issues.append(f"Subject mismatch: file says '{metadata.get('subject')}', expected '{subject_code}'")
@@ -69,91 +185,97 @@ def validate_course_file(file_path: str, subject_code: str, progress_data: Optio
     if scraped_count != actual_count:
         issues.append(f"Course count mismatch: metadata says {scraped_count}, found {actual_count} courses")
     
-    if actual_count == 0:
-        issues.append("No courses found in file")
+    is_empty = actual_count == 0
+    if is_empty:
+        issues.append(NO_COURSES_ISSUE)
     
     # Validate against progress data if available
-    if progress_data and 'scraping_log' in progress_data and 'subjects' in progress_data['scraping_log']:
-        subject_progress = progress_data['scraping_log']['subjects'].get(subject_code)
-        if subject_progress:
-            # Check completion status
-            if subject_progress.get('status') != 'completed':
-                issues.append(f"Subject status is '{subject_progress.get('status')}', not 'completed'")
-            
-            # Check course count consistency
-            expected_count = subject_progress.get('courses_count', 0)
-            scraped_count_progress = subject_progress.get('courses_scraped', 0)
-            
-            if expected_count != scraped_count_progress:
-                issues.append(f"Progress mismatch: expected {expected_count}, scraped {scraped_count_progress}")
-            
-            if actual_count != scraped_count_progress:
-                issues.append(f"File vs progress mismatch: file has {actual_count}, progress says {scraped_count_progress}")
+    if subject_progress:
+        # Check completion status
+        if subject_progress.get('status') != 'completed':
+            issues.append(f"Subject status is '{subject_progress.get('status')}', not 'completed'")
+        
+        # Check course count consistency
+        expected_count = subject_progress.get('courses_count', 0)
+        scraped_count_progress = subject_progress.get('courses_scraped', 0)
+        
+        if expected_count != scraped_count_progress:
+            issues.append(f"Progress mismatch: expected {expected_count}, scraped {scraped_count_progress}")
+        
+        if actual_count != scraped_count_progress:
+            issues.append(f"File vs progress mismatch: file has {actual_count}, progress says {scraped_count_progress}")
     
     # Check course structure (sample a few courses)
-    for i, course in enumerate(courses[:3]):  # Check first 3 courses
+    for i, course in enumerate(islice(courses, 3)):  # Check first 3 courses (no slice copy)
         if not isinstance(course, dict):
             issues.append(f"Course {i+1} is not a valid object")
             continue
         
-        required_fields = ['subject', 'course_code', 'title', 'credits']
-        for field in required_fields:
+        for field in REQUIRED_COURSE_FIELDS:
             if field not in course:
                 issues.append(f"Course {i+1} missing required field '{field}'")
         
         # Check if subject matches
-        if course.get('subject') != subject_code:
-            issues.append(f"Course {i+1} subject mismatch: '{course.get('subject')}' vs '{subject_code}'")
+        course_subject = course.get('subject')
+        if course_subject != subject_code:
+            issues.append(f"Course {i+1} subject mismatch: '{course_subject}' vs '{subject_code}'")
     
-    return len(issues) == 0, issues
+    return len(issues) == 0, issues, is_empty
 
-def find_course_files() -> List[str]:
+def find_course_files() -> List[Tuple[str, str]]:
     """
     Find all 4-letter course JSON files in /data directory,
     excluding EX_ prefixed files (exempt courses with no actual course data)
     Validates file naming and warns about unexpected files
+    Returns (file_path, subject_code) pairs sorted by name
     """
     data_dir = "data"
     if not os.path.exists(data_dir):
         return []
 
-    # Find JSON files with exactly 4 letter names
-    pattern = os.path.join(data_dir, "*.json")
-    all_files = glob.glob(pattern)
-
     course_files = []
     excluded_files = []
     unexpected_files = []
 
-    for file_path in all_files:
-        filename = os.path.basename(file_path)
-        name_without_ext = os.path.splitext(filename)[0]  # Remove extension
+    # Single directory scan - DirEntry gives the name and file type without extra stat calls
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            filename = entry.name
+            if not filename.endswith('.json') or filename.startswith('.') or not entry.is_file():
+                continue
 
-        # Exclude EX_ prefixed files (exemption placeholders with no courses)
-        if name_without_ext.startswith('EX_'):
-            excluded_files.append(name_without_ext)
-            continue
+            file_path = entry.path
+            name_without_ext = filename[:-5]  # Remove .json extension
 
-        # Validate it's a proper 4-letter subject code
-        if len(name_without_ext) == 4 and name_without_ext.isalpha() and name_without_ext.isupper():
-            course_files.append(file_path)
-        else:
-            # Unexpected file format - report but don't include
-            unexpected_files.append(filename)
+            # Exclude EX_ prefixed files (exemption placeholders with no courses)
+            if name_without_ext.startswith('EX_'):
+                excluded_files.append(name_without_ext)
+                continue
+
+            # Validate it's a proper 4-letter subject code
+            if SUBJECT_FILE_PATTERN.fullmatch(filename):
+                course_files.append((file_path, name_without_ext))
+            else:
+                # Unexpected file format - report but don't include
+                unexpected_files.append(filename)
+
+    # Sort in place (directory order is arbitrary) - no extra list copies
+    course_files.sort()
+    excluded_files.sort()
+    unexpected_files.sort()
 
     # Report excluded files
     if excluded_files:
-        print(f"🚫 Excluded {len(excluded_files)} EX_ prefixed files: {', '.join(sorted(excluded_files))}")
+        print(f"🚫 Excluded {len(excluded_files)} EX_ prefixed files: {', '.join(excluded_files)}")
         print()
 
     # Warn about unexpected files
     if unexpected_files:
         print(f"⚠️  Found {len(unexpected_files)} unexpected files in /data:")
-        for f in sorted(unexpected_files):
-            print(f"   - {f}")
+        print('\n'.join(f"   - {f}" for f in unexpected_files))
         print()
 
-    return sorted(course_files)
+    return course_files
 
 def validate_subject_list(found_subjects: List[str]) -> None:
     """
@@ -174,8 +296,7 @@ def validate_subject_list(found_subjects: List[str]) -> None:
             content = f.read()
 
         # Find ALL_SUBJECTS array using regex
-        pattern = r'const ALL_SUBJECTS = \[([\s\S]*?)\]'
-        match = re.search(pattern, content)
+        match = ALL_SUBJECTS_PATTERN.search(content)
 
         if not match:
             print("⚠️ Could not find ALL_SUBJECTS in CourseSearch.tsx")
@@ -185,7 +306,7 @@ def validate_subject_list(found_subjects: List[str]) -> None:
         # Parse the array content
         array_content = match.group(1)
         # Extract subject codes (remove quotes, whitespace, commas)
-        hardcoded_subjects = re.findall(r"'([A-Z]{4})'", array_content)
+        hardcoded_subjects = QUOTED_SUBJECT_PATTERN.findall(array_content)
 
         # Compare lists
         found_set = set(found_subjects)
@@ -219,39 +340,33 @@ def calculate_scraping_statistics(progress_data: Optional[Dict]) -> Optional[Dic
     if 'subjects' not in scraping_log:
         return None
     
-    total_minutes = 0
     completed_subjects = 0
     failed_subjects = 0
     total_courses = 0
-    fastest_subject = None
-    slowest_subject = None
-    min_time = float('inf')
-    max_time = 0
+    timed_subjects = []  # (subject_code, duration, courses_count) for completed subjects with a duration
     
     for subject_code, subject_data in scraping_log['subjects'].items():
         status = subject_data.get('status')
-        duration = subject_data.get('duration_minutes', 0)
-        courses_count = subject_data.get('courses_scraped', 0)
         
         if status == 'completed':
             completed_subjects += 1
+            courses_count = subject_data.get('courses_scraped', 0)
             total_courses += courses_count
             
+            duration = subject_data.get('duration_minutes', 0)
             if duration > 0:
-                total_minutes += duration
-                
-                # Track fastest/slowest subjects
-                if duration < min_time:
-                    min_time = duration
-                    fastest_subject = (subject_code, duration, courses_count)
-                
-                if duration > max_time:
-                    max_time = duration
-                    slowest_subject = (subject_code, duration, courses_count)
+                timed_subjects.append((subject_code, duration, courses_count))
         
         elif status == 'failed':
             failed_subjects += 1
     
+    # Aggregate durations with builtin reductions instead of per-subject comparisons
+    # (ties keep the first subject encountered, as before)
+    by_duration = itemgetter(1)
+    total_minutes = sum(map(by_duration, timed_subjects))
+    fastest_subject = min(timed_subjects, key=by_duration, default=None)
+    slowest_subject = max(timed_subjects, key=by_duration, default=None)
+    
     # Calculate average time per course
     avg_time_per_course = total_minutes / total_courses if total_courses > 0 else 0
     avg_time_per_subject = total_minutes / completed_subjects if completed_subjects > 0 else 0
@@ -267,6 +382,39 @@ def calculate_scraping_statistics(progress_data: Optional[Dict]) -> Optional[Dic
         'slowest_subject': slowest_subject
     }
 
+def copy_course_file(src: str, dest: str) -> None:
+    """
+    Copy a course file's contents with os.copy_file_range where available, so the kernel
+    copies (or reflinks, on CoW filesystems like Btrfs/XFS) without userspace buffers.
+    Falls back to shutil.copyfile if the fast path is unsupported. Metadata (mtime,
+    permissions) is not copied - published files only need their contents.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dest, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return
+        except OSError:
+            pass  # e.g. cross-device copy on older kernels - use the portable path
+
+    shutil.copyfile(src, dest)
+
+def move_course_file(src: str, dest: str) -> None:
+    """
+    Move a course file instead of copying it: a single rename when source and
+    destination share a filesystem, falling back to copy + delete across devices
+    """
+    try:
+        os.replace(src, dest)
+    except OSError:
+        shutil.move(src, dest)
+
 def format_duration(minutes: float) -> str:
     """Format duration in a human-readable way"""
     if minutes < 60:
@@ -281,24 +429,36 @@ def format_duration(minutes: float) -> str:
         return f"{hours} hours {remaining_minutes:.1f} minutes"
 
 class ConsoleLogger:
-    """Captures console output to both terminal and file"""
+    """Captures console output to both terminal and file, batching writes in memory"""
+    BUFFER_LIMIT = 8192  # Characters buffered before writing through to both sinks
+
     def __init__(self, filename):
         self.terminal = sys.stdout
         self.log_file = open(filename, 'w', encoding='utf-8')
+        self.buffer = io.StringIO()
 
     def write(self, message):
-        self.terminal.write(message)
-        self.log_file.write(message)
+        self.buffer.write(message)
+        if self.buffer.tell() > self.BUFFER_LIMIT:
+            self.flush()
 
     def flush(self):
+        pending = self.buffer.getvalue()
+        if pending:
+            self.terminal.write(pending)
+            self.log_file.write(pending)
+            self.buffer.seek(0)
+            self.buffer.truncate()
         self.terminal.flush()
         self.log_file.flush()
 
     def close(self):
+        self.flush()
         self.log_file.close()
 
     def get_user_input(self, prompt: str) -> str:
         """Get user input while temporarily restoring terminal output"""
+        self.flush()  # Show everything printed so far before prompting
         sys.stdout = self.terminal
         try:
             answer = input(prompt).strip().lower()
@@ -328,6 +488,15 @@ def main():
         if dry_run:
             print("🔍 DRY RUN MODE - No files will be copied")
             print()
+
+        # Check for no-validate flag (fast path for re-publishing already-checked data)
+        skip_validation = '--no-validate' in sys.argv
+
+        # Check for move flag (publish by moving files out of /data instead of copying)
+        move_files = '--move' in sys.argv
+        if move_files and not dry_run:
+            print("🚚 MOVE MODE - Published files will be removed from /data")
+            print()
         
         # Load progress data (one-line summary)
         progress_data = load_scraping_progress()
@@ -354,7 +523,7 @@ def main():
             return
 
         # Validate subject list against CourseSearch.tsx
-        found_subjects = [os.path.splitext(os.path.basename(f))[0] for f in course_files]  # Extract subject codes
+        found_subjects = [subject_code for _, subject_code in course_files]
         validate_subject_list(found_subjects)
 
         # Create destination directory
@@ -362,42 +531,43 @@ def main():
         if not dry_run:
             os.makedirs(dest_dir, exist_ok=True)
 
-        # Validate and categorize files
+        # Validate and categorize files in a single pass
         valid_files = []
         problematic_files = []
         empty_subjects = []
-        for file_path in course_files:
-            filename = os.path.basename(file_path)
-            subject_code = os.path.splitext(filename)[0]  # Remove extension
-
-            is_valid, issues = validate_course_file(file_path, subject_code, progress_data)
+        non_empty_problematic = []  # (subject_code, issues) for problems other than an empty subject
+        if skip_validation:
+            valid_files = [file_path for file_path, _ in course_files]
+            print("⏭️ Validation skipped (--no-validate) - publishing all course files as-is")
+        else:
+            validation_cache = load_validation_cache()
+            subjects_progress = (progress_data or {}).get('scraping_log', {}).get('subjects', {})  # Looked up once, not per file
+            for file_path, subject_code in course_files:
+                subject_progress = subjects_progress.get(subject_code)
+                is_valid, issues, is_empty = validate_course_file(file_path, subject_code, subject_progress, validation_cache)
             
-            if is_valid:
-                valid_files.append(file_path)
+                if is_valid:
+                    valid_files.append(file_path)
+                else:
+                    problematic_files.append((file_path, issues))
+                    # Check if this subject has no courses
+                    if is_empty:
+                        empty_subjects.append(subject_code)
+                    else:
+                        non_empty_problematic.append((subject_code, issues))
+            save_validation_cache(validation_cache, [file_path for file_path, _ in course_files])
+
+            # Report subjects with no courses (compact single-line format)
+            if empty_subjects:
+                print(f"📭 Subjects with no courses ({len(empty_subjects)}): {', '.join(sorted(empty_subjects))}")
             else:
-                problematic_files.append((file_path, issues))
-                # Check if this subject has no courses
-                if any("No courses found" in issue for issue in issues):
-                    empty_subjects.append(subject_code)
-
-        # Report subjects with no courses (compact single-line format)
-        if empty_subjects:
-            print(f"📭 Subjects with no courses ({len(empty_subjects)}): {', '.join(sorted(empty_subjects))}")
-        else:
-            print("✅ All subjects have courses")
-        
-        # Report other problematic files (not empty)
-        non_empty_problematic = [
-            (file_path, issues) for file_path, issues in problematic_files 
-            if not any("No courses found" in issue for issue in issues)
-        ]
+                print("✅ All subjects have courses")
         
-        if non_empty_problematic:
-            print(f"⚠️ Files with other issues ({len(non_empty_problematic)}):")
-            for file_path, issues in non_empty_problematic:
-                filename = os.path.basename(file_path)
-                subject_code = os.path.splitext(filename)[0]
-                print(f"   - {subject_code}: {', '.join(issues)}")
+            # Report other problematic files (not empty)
+            if non_empty_problematic:
+                print(f"⚠️ Files with other issues ({len(non_empty_problematic)}):")
+                print('\n'.join(f"   - {subject_code}: {', '.join(issues)}"
+                                for subject_code, issues in non_empty_problematic))
 
         # Determine files to copy (all valid files by default)
         files_to_copy = valid_files.copy()
@@ -412,7 +582,7 @@ def main():
             include_problematic = logger.get_user_input("Include problematic files in migration? [y/N]: ")
 
             if include_problematic in ['y', 'yes']:
-                files_to_copy.extend([file_path for file_path, _ in problematic_files])
+                files_to_copy.extend(file_path for file_path, _ in problematic_files)
                 print("➡️ Including all problematic files in copy operation")
             else:
                 print("⏭️ Skipping problematic files")
@@ -438,10 +608,13 @@ def main():
 
             try:
                 if not dry_run:
-                    shutil.copy2(file_path, dest_path)
+                    if move_files:
+                        move_course_file(file_path, dest_path)
+                    else:
+                        copy_course_file(file_path, dest_path)
                 copied_count += 1
             except Exception as e:
-                print(f"❌ Failed to copy {filename}: {e}")
+                print(f"❌ Failed to {'move' if move_files else 'copy'} {filename}: {e}")
 
         # Publishing summary
         print("📋 Publishing Summary:")
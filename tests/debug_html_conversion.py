@@ -4,10 +4,24 @@ Debug script to simulate the exact HTML-to-Markdown conversion process
 that happens in the scraper for Course Outcome data.
 """
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import os
+import re
 import sys
 
+# Single-pass version of the step-6 cleanup: line-leading whitespace (which
+# also swallows blank lines) is dropped, other space/NBSP runs become one space
+CLEANUP_PATTERN = re.compile(r'(^\s+)|[ \xa0]+', re.MULTILINE)
+
+def find_all(haystack, needle):
+    """Return every start index of needle in haystack using str.find"""
+    locations = []
+    index = haystack.find(needle)
+    while index != -1:
+        locations.append(index)
+        index = haystack.find(needle, index + 1)
+    return locations
+
 def test_html_conversion():
     """Simulate the exact process that happens in the scraper"""
     
@@ -31,7 +45,9 @@ def test_html_conversion():
     
     # Parse with BeautifulSoup (same as scraper)
     print("=== STEP 2: BeautifulSoup Parsing ===")
-    soup = BeautifulSoup(html_content, 'html.parser')
+    # Only build the target span's subtree instead of the whole page DOM
+    only_span = SoupStrainer('span', id='uc_course_outcome_lbl_rec_reading')
+    soup = BeautifulSoup(html_content, 'html.parser', parse_only=only_span)
     
     # Try to find the span (if the file contains the full page)
     recommended_reading_span = soup.find('span', {'id': 'uc_course_outcome_lbl_rec_reading'})
@@ -41,7 +57,12 @@ def test_html_conversion():
         span_html = str(recommended_reading_span)
     else:
         print("⚠️ No span with id found, assuming file contains just the span content")
-        span_html = str(soup)
+        span_html = str(BeautifulSoup(html_content, 'html.parser'))
+    
+    # Free the parse tree before markdownify builds its own (bs4 trees are reference
+    # cycles, so they would otherwise linger until the cyclic GC runs)
+    soup.decompose()
+    del soup, recommended_reading_span
     
     print(f"Span HTML length: {len(span_html)} characters")
     print("First 200 chars of span HTML:", repr(span_html[:200]))
@@ -63,13 +84,15 @@ def test_html_conversion():
         print("=== STEP 4: Analysis ===")
         
         # Check for the problematic artifacts
-        if "if !supportLists?" in markdown_result:
+        support_lists_locations = find_all(markdown_result, "if !supportLists?")
+        if support_lists_locations:
             print("🔴 FOUND: 'if !supportLists?' artifact!")
-            print("Locations:", [i for i in range(len(markdown_result)) if markdown_result[i:].startswith("if !supportLists?")])
+            print("Locations:", support_lists_locations)
         
-        if "endif?" in markdown_result:
+        endif_locations = find_all(markdown_result, "endif?")
+        if endif_locations:
             print("🔴 FOUND: 'endif?' artifact!")
-            print("Locations:", [i for i in range(len(markdown_result)) if markdown_result[i:].startswith("endif?")])
+            print("Locations:", endif_locations)
         
         if "<!--[if !supportLists]-->" in span_html:
             print("🔍 ORIGINAL: Found '<!--[if !supportLists]-->' in HTML")
@@ -136,15 +159,11 @@ def test_html_conversion():
                 f.write("⚠️ Found non-breaking spaces - likely from Word HTML!\n")
         
         # Step 6: Cleaned markdown (potential fix)
-        import re
-        cleaned_markdown = markdown_result
-        # Replace non-breaking spaces with regular spaces
-        cleaned_markdown = cleaned_markdown.replace('\xa0', ' ')
-        # Clean up excessive whitespace while preserving structure
-        cleaned_markdown = re.sub(r'^\s+', '', cleaned_markdown, flags=re.MULTILINE)  # Remove leading whitespace from each line
-        cleaned_markdown = re.sub(r' +', ' ', cleaned_markdown)    # Multiple spaces → single space
-        cleaned_markdown = re.sub(r'\n\s*\n\s*\n+', '\n\n', cleaned_markdown)  # Multiple newlines → double newlines
-        cleaned_markdown = cleaned_markdown.strip()
+        # Non-breaking spaces → spaces, strip leading whitespace from each line,
+        # multiple spaces → single space, all in one scan of the buffer
+        cleaned_markdown = CLEANUP_PATTERN.sub(
+            lambda m: '' if m.group(1) else ' ', markdown_result
+        ).strip()
         
         with open(f"{output_dir}/step6_cleaned_markdown.md", "w", encoding="utf-8") as f:
             f.write(cleaned_markdown)
@@ -154,8 +173,8 @@ def test_html_conversion():
             f.write(f"Original length: {len(markdown_result)} characters\n")
             f.write(f"Cleaned length: {len(cleaned_markdown)} characters\n")
             f.write(f"Reduction: {len(markdown_result) - len(cleaned_markdown)} characters\n")
-            f.write(f"\nOriginal first line: {repr(markdown_result.split(chr(10))[0])}\n")
-            f.write(f"Cleaned first line: {repr(cleaned_markdown.split(chr(10))[0])}\n")
+            f.write(f"\nOriginal first line: {repr(markdown_result.partition(chr(10))[0])}\n")
+            f.write(f"Cleaned first line: {repr(cleaned_markdown.partition(chr(10))[0])}\n")
         
         print(f"📁 Step-by-step analysis written to {output_dir}/:")
         print("  - step1_original_html.txt")
@@ -170,7 +189,7 @@ def test_html_conversion():
         print("=== STEP 6: Conclusion ===")
         
         # Find where the transformation happens
-        if "<!--[if !supportLists]-->" in span_html and "if !supportLists?" in markdown_result:
+        if "<!--[if !supportLists]-->" in span_html and support_lists_locations:
             print("🎯 TRANSFORMATION DETECTED:")
             print("  HTML: <!--[if !supportLists]-->")
             print("  →    if !supportLists?")
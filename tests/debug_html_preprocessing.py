@@ -4,55 +4,76 @@ Debug script to test robust HTML pre-processing approach for Course Outcome data
 This tests cleaning Word HTML artifacts BEFORE markdownify conversion.
 """
 
-from bs4 import BeautifulSoup, Comment
+from bs4 import BeautifulSoup, Comment, SoupStrainer, Tag
 import os
 import re
+from pathlib import Path
+try:
+    from markdownify import MarkdownConverter
+except ImportError:
+    MarkdownConverter = None
 
-def clean_word_html(html_content: str) -> str:
-    """Clean Word-specific HTML artifacts before markdown conversion"""
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
-    # Remove Word-specific elements entirely
-    for element in soup.find_all(['meta', 'link', 'style', 'xml']):
-        element.decompose()
-    
-    # Remove Word conditional comments
-    comments_to_remove = []
-    for element in soup.contents:
-        if hasattr(element, 'string') and element.string:
-            # This catches Comment objects
-            if isinstance(element, Comment):
-                comment_text = str(element)
+# Word-specific elements removed entirely, and containers removed when left empty
+WORD_ONLY_TAGS = frozenset(['meta', 'link', 'style', 'xml'])
+CONTAINER_TAGS = frozenset(['span', 'div', 'p'])
+
+# Word-specific attributes removed from every tag ('class' is a prefix match, as before)
+WORD_ATTR_PREFIXES = ('mso-', 'o:', 'v:', 'w:', 'class')
+WORD_ATTRS = frozenset(['style', 'lang'])
+
+# Numbered list ("1."), bullet ("-", "*", "+") or header ("#" to "######") with any following spaces
+MARKDOWN_PREFIX_PATTERN = re.compile(r'(?:(?P<number>\d+)\.|(?P<marker>[-*+]|#{1,6}))\s*')
+MULTIPLE_SPACES_PATTERN = re.compile(r'  +')
+BLANK_LINES_PATTERN = re.compile(r'\n\s*\n\s*\n+')
+
+def clean_word_soup(soup: BeautifulSoup) -> None:
+    """Clean Word-specific HTML artifacts in place, so the same tree can go straight to markdownify"""
+    # Single walk over the tree: drop Word-only elements (without descending into them),
+    # remove top-level Word conditional comments, strip Word attributes and convert
+    # non-breaking spaces; span/div/p tags are remembered for the empty-element check
+    containers = []
+    stack = [soup]
+    while stack:
+        parent = stack.pop()
+        for node in list(parent.contents):
+            if isinstance(node, Tag):
+                if node.name in WORD_ONLY_TAGS:
+                    # Remove Word-specific elements entirely
+                    node.decompose()
+                    continue
+                
+                # Remove Word-specific attributes
+                if node.attrs:
+                    node.attrs = {attr: value for attr, value in node.attrs.items()
+                                  if attr not in WORD_ATTRS and not attr.startswith(WORD_ATTR_PREFIXES)}
+                
+                if node.name in CONTAINER_TAGS:
+                    containers.append(node)
+                stack.append(node)
+                continue
+            
+            # Remove Word conditional comments
+            if parent is soup and isinstance(node, Comment) and node.string:
+                comment_text = str(node)
                 if ('if' in comment_text and 
                     ('supportLists' in comment_text or 'mso' in comment_text or 'endif' in comment_text)):
-                    comments_to_remove.append(element)
-    
-    # Remove the comments
-    for comment in comments_to_remove:
-        comment.extract()
-    
-    # Clean Word-specific attributes from all tags
-    for tag in soup.find_all():
-        if hasattr(tag, 'attrs'):
-            # Remove Word-specific attributes
-            attrs_to_remove = [attr for attr in tag.attrs.keys() 
-                              if attr.startswith(('mso-', 'o:', 'v:', 'w:', 'class')) 
-                              or attr in ['style', 'lang']]
-            for attr in attrs_to_remove:
-                if attr in tag.attrs:
-                    del tag[attr]
-    
-    # Convert non-breaking spaces to regular spaces in text content
-    for text_node in soup.find_all(string=True):
-        if text_node.string and '\xa0' in text_node.string:
-            text_node.string.replace_with(text_node.string.replace('\xa0', ' '))
-    
-    # Remove empty elements that might be left behind
-    for tag in soup.find_all():
-        if tag.name in ['span', 'div', 'p'] and not tag.get_text(strip=True) and not tag.find_all():
-            tag.decompose()
-    
-    return str(soup)
+                    node.extract()
+                    continue
+            
+            # Convert non-breaking spaces to regular spaces in text content
+            if '\xa0' in node:
+                node.replace_with(node.replace('\xa0', ' '))
+    
+    # Remove empty elements that might be left behind (judged on the cleaned tree, so the
+    # result does not depend on the order in which they are removed)
+    empty_containers = [tag for tag in containers
+                        if not any(isinstance(child, Tag) for child in tag.contents)
+                        and not tag.get_text(strip=True)]
+    for tag in empty_containers:
+        tag.decompose()
+    
+    # Merge text nodes left adjacent by the removals, as re-parsing the cleaned HTML would
+    soup.smooth()
 
 def normalize_whitespace_markdown_aware(text: str) -> str:
     """Clean whitespace while preserving markdown syntax for proper rendering"""
@@ -72,21 +93,21 @@ def normalize_whitespace_markdown_aware(text: str) -> str:
             continue
         
         # Step 2: Handle markdown syntax elements
-        if re.match(r'^\d+\.', stripped):
+        prefix = MARKDOWN_PREFIX_PATTERN.match(stripped)
+        if prefix and prefix['number']:
             # Numbered list: ensure exactly "1. " format (space required for markdown)
-            line = re.sub(r'^(\d+)\.\s*', r'\1. ', stripped)
-        elif re.match(r'^[-*+]', stripped):
-            # Bullet list: ensure exactly "- " format  
-            line = re.sub(r'^([-*+])\s*', r'\1 ', stripped)
-        elif re.match(r'^#{1,6}', stripped):
-            # Headers: ensure exactly "# " format
-            line = re.sub(r'^(#{1,6})\s*', r'\1 ', stripped)
+            line = prefix['number'] + '. ' + stripped[prefix.end():]
+        elif prefix:
+            # Bullet list or header: ensure exactly "- " / "# " format
+            line = prefix['marker'] + ' ' + stripped[prefix.end():]
         else:
             # Regular line: just use stripped version
             line = stripped
         
         # Step 3: Clean excessive internal spaces (but preserve single spaces)
-        line = re.sub(r'  +', ' ', line)
+        # (halving runs with str.replace - cheaper than a regex for short lines, and skipped when clean)
+        while '  ' in line:
+            line = line.replace('  ', ' ')
         
         cleaned_lines.append(line)
     
@@ -94,7 +115,7 @@ def normalize_whitespace_markdown_aware(text: str) -> str:
     text = '\n'.join(cleaned_lines)
     
     # Multiple consecutive blank lines → single blank line (for readability)
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+    text = BLANK_LINES_PATTERN.sub('\n\n', text)
     
     return text.strip()
 
@@ -119,7 +140,9 @@ def test_robust_html_processing():
     
     # Step 1: Parse with BeautifulSoup to get the span
     print("=== STEP 1: Extract Target Span ===")
-    soup = BeautifulSoup(html_content, 'html.parser')
+    # Only build the target span's subtree instead of the whole Word HTML page
+    only_span = SoupStrainer('span', id='uc_course_outcome_lbl_rec_reading')
+    soup = BeautifulSoup(html_content, 'html.parser', parse_only=only_span)
     recommended_reading_span = soup.find('span', {'id': 'uc_course_outcome_lbl_rec_reading'})
     
     if recommended_reading_span:
@@ -127,14 +150,16 @@ def test_robust_html_processing():
         span_html = str(recommended_reading_span)
     else:
         print("⚠️ Using entire content as span")
+        soup = BeautifulSoup(html_content, 'html.parser')
         span_html = str(soup)
     
     print(f"Span HTML length: {len(span_html)} characters")
     print()
     
-    # Step 2: Clean Word HTML artifacts
+    # Step 2: Clean Word HTML artifacts (in place - this tree is reused for the markdown conversion)
     print("=== STEP 2: Clean Word HTML Artifacts ===")
-    cleaned_html = clean_word_html(span_html)
+    clean_word_soup(soup)
+    cleaned_html = str(soup)
     print(f"Cleaned HTML length: {len(cleaned_html)} characters")
     print(f"Size reduction: {len(span_html) - len(cleaned_html)} characters")
     
@@ -154,12 +179,11 @@ def test_robust_html_processing():
     
     # Step 3: Convert to markdown
     print("=== STEP 3: Convert to Markdown ===")
-    try:
-        import markdownify
+    if MarkdownConverter is not None:
         print("✅ markdownify available")
         
-        # Convert cleaned HTML to markdown
-        markdown_result = markdownify.markdownify(cleaned_html, heading_style="ATX")
+        # Convert the cleaned tree to markdown (no re-parse of cleaned_html)
+        markdown_result = MarkdownConverter(heading_style="ATX").convert_soup(soup)
         print(f"Raw markdown length: {len(markdown_result)} characters")
         
         # Apply markdown-aware whitespace normalization
@@ -168,32 +192,28 @@ def test_robust_html_processing():
         print(f"Final reduction: {len(markdown_result) - len(final_markdown)} characters")
         print()
         
-    except ImportError:
+    else:
         print("❌ markdownify not available")
         return
     
     # Step 4: Write clean output files for preview
     print("=== STEP 4: Write Files for Preview ===")
-    output_dir = "tests/output/debug_html_preprocessing"
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Pure HTML files (no analysis text - for direct browser preview)
-    with open(f"{output_dir}/original_span.html", "w", encoding="utf-8") as f:
-        f.write(span_html)
-    
-    with open(f"{output_dir}/cleaned_html.html", "w", encoding="utf-8") as f:
-        f.write(cleaned_html)
-    
-    # Pure markdown files
-    with open(f"{output_dir}/raw_markdown.md", "w", encoding="utf-8") as f:
-        f.write(markdown_result)
-    
-    with open(f"{output_dir}/final_markdown.md", "w", encoding="utf-8") as f:
-        f.write(final_markdown)
-    
-    # Raw text representation for debugging
-    with open(f"{output_dir}/raw_markdown_repr.txt", "w", encoding="utf-8") as f:
-        f.write(repr(markdown_result))
+    output_dir = Path("tests/output/debug_html_preprocessing")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Each file is encoded once and written with a single write_bytes call
+    output_files = [
+        # Pure HTML files (no analysis text - for direct browser preview)
+        ("original_span.html", span_html),
+        ("cleaned_html.html", cleaned_html),
+        # Pure markdown files
+        ("raw_markdown.md", markdown_result),
+        ("final_markdown.md", final_markdown),
+        # Raw text representation for debugging
+        ("raw_markdown_repr.txt", repr(markdown_result)),
+    ]
+    for filename, content in output_files:
+        (output_dir / filename).write_bytes(content.encode('utf-8'))
     
     print(f"📁 Files written to {output_dir}/:")
     print("  - original_span.html (open in browser)")
@@ -223,7 +243,7 @@ def test_robust_html_processing():
     leading_spaces_final = len(final_markdown) - len(final_markdown.lstrip())
     print(f"   Leading whitespace: {leading_spaces_raw} → {leading_spaces_final}")
     print(f"   Non-breaking spaces in final: {final_markdown.count(chr(160))}")
-    print(f"   Multiple spaces in final: {bool(re.search(r'  +', final_markdown))}")
+    print(f"   Multiple spaces in final: {bool(MULTIPLE_SPACES_PATTERN.search(final_markdown))}")
     
     # Check markdown syntax preservation
     numbered_lists_raw = len(re.findall(r'^\d+\. ', markdown_result, re.MULTILINE))
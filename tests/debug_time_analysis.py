@@ -3,44 +3,39 @@
 Debug script to check time data in course files
 """
 
-import json
 import glob
 import re
 from typing import Tuple
+try:
+    from orjson import loads as json_loads  # Parses bytes directly, several times faster than json
+except ImportError:
+    from json import loads as json_loads  # Stdlib fallback (also accepts UTF-8 bytes)
+
+# "9:30AM - 12:15PM"
+AM_PM_TIME_PATTERN = re.compile(r'(\d{1,2}):(\d{2})(AM|PM)\s*-\s*(\d{1,2}):(\d{2})(AM|PM)', re.IGNORECASE)
+# "09:30 - 10:15"
+TIME_24H_PATTERN = re.compile(r'(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})')
 
 def parse_time_string(time_str: str) -> Tuple[int, int, int, int]:
     """Parse time string and return (start_hour, start_min, end_hour, end_min)"""
-    if not time_str or time_str.upper() == 'TBA':
+    # Both formats need a colon, so this also rejects 'TBA' without case-folding it
+    if not time_str or ':' not in time_str:
         return (-1, -1, -1, -1)
     
-    # Try AM/PM format first: "9:30AM - 12:15PM"
-    am_pm_pattern = r'(\d{1,2}):(\d{2})(AM|PM)\s*-\s*(\d{1,2}):(\d{2})(AM|PM)'
-    match = re.search(am_pm_pattern, time_str, re.IGNORECASE)
+    # Try AM/PM format first: "9:30AM - 12:15PM" (only possible if an 'M' is present)
+    match = AM_PM_TIME_PATTERN.search(time_str) if 'M' in time_str or 'm' in time_str else None
     
     if match:
-        start_hour = int(match.group(1))
+        # Convert to 24-hour format (12AM → 0, 12PM → 12, 1PM → 13)
+        start_hour = int(match.group(1)) % 12 + (12 if match.group(3).upper() == 'PM' else 0)
         start_min = int(match.group(2))
-        start_period = match.group(3).upper()
-        end_hour = int(match.group(4))
+        end_hour = int(match.group(4)) % 12 + (12 if match.group(6).upper() == 'PM' else 0)
         end_min = int(match.group(5))
-        end_period = match.group(6).upper()
-        
-        # Convert to 24-hour format
-        if start_period == 'PM' and start_hour != 12:
-            start_hour += 12
-        elif start_period == 'AM' and start_hour == 12:
-            start_hour = 0
-            
-        if end_period == 'PM' and end_hour != 12:
-            end_hour += 12
-        elif end_period == 'AM' and end_hour == 12:
-            end_hour = 0
         
         return (start_hour, start_min, end_hour, end_min)
     
     # Fallback to 24-hour format: "09:30 - 10:15"
-    time_pattern = r'(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})'
-    match = re.search(time_pattern, time_str)
+    match = TIME_24H_PATTERN.search(time_str)
     
     if match:
         start_hour = int(match.group(1))
@@ -64,8 +59,8 @@ def main():
     print(f"🎯 Analyzing first file: {json_files[0]}")
     
     # Load first file
-    with open(json_files[0], 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(json_files[0], 'rb') as f:
+        data = json_loads(f.read())
     
     courses = data.get('courses', [])
     print(f"📚 Found {len(courses)} courses in file")
@@ -118,14 +113,11 @@ def main():
     if valid_times:
         # Calculate correct ranges
         start_hours = [t[0] for t in valid_times]
-        start_mins = [t[1] for t in valid_times]
         end_hours = [t[2] for t in valid_times]
-        end_mins = [t[3] for t in valid_times]
         
-        earliest_start_h = min(start_hours)
-        earliest_start_m = min([t[1] for t in valid_times if t[0] == earliest_start_h])
-        latest_end_h = max(end_hours)
-        latest_end_m = max([t[3] for t in valid_times if t[2] == latest_end_h])
+        # (hour, minute) tuples compare lexicographically, so one min/max pass finds each bound
+        earliest_start_h, earliest_start_m = min(t[:2] for t in valid_times)
+        latest_end_h, latest_end_m = max(t[2:] for t in valid_times)
         
         print(f"\n⏰ CORRECT TIME RANGES:")
         print(f"   Earliest start: {earliest_start_h:02d}:{earliest_start_m:02d}")
@@ -5,8 +5,11 @@ import os
 # Suppress ONNX warnings like in your example
 onnxruntime.set_default_logger_severity(3)
 
+# Run the model on the GPU when this onnxruntime build has CUDA (ddddocr falls back to CPU otherwise)
+USE_GPU = 'CUDAExecutionProvider' in onnxruntime.get_available_providers()
+
 def test_ddddocr_captcha():
-    ocr = ddddocr.DdddOcr()
+    ocr = ddddocr.DdddOcr(use_gpu=USE_GPU)
     
     captcha_files = [
         ('sample-webpages/sample_captcha_G6J1.png', 'G6J1'),
@@ -21,11 +24,11 @@ def test_ddddocr_captcha():
                 with open(file_path, 'rb') as f:
                     image_bytes = f.read()
                 
-                # Test multiple times to see consistency
-                for attempt in range(5):
-                    result = ocr.classification(image_bytes)
-                    result_clean = result.strip().upper()
-                    print(f"Attempt {attempt + 1}: '{result_clean}' (match: {result_clean == expected})")
+                # One pass is enough: ONNX Runtime inference is deterministic for the same
+                # image bytes, so repeated attempts only re-run the same forward pass
+                result = ocr.classification(image_bytes)
+                result_clean = result.strip().upper()
+                print(f"Result: '{result_clean}' (match: {result_clean == expected})")
                 
             except Exception as e:
                 print(f"Error: {e}")
@@ -6,6 +6,11 @@ Test script to verify that debug HTML files are saved for class details pages
 from cuhk_scraper import CuhkScraper, ScrapingConfig
 import os
 
+def list_html_files(directory):
+    """Names of the .html files in directory (one scandir pass, no intermediate name list)"""
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries if entry.name.endswith('.html')}
+
 def test_debug_html_saving():
     scraper = CuhkScraper()
     config = ScrapingConfig(
@@ -18,21 +23,27 @@ def test_debug_html_saving():
     print('This will test if sections and class details HTML files are saved')
     
     # Clear old debug files
-    debug_files_before = set(f for f in os.listdir('tests/output') if f.endswith('.html'))
+    debug_files_before = list_html_files('tests/output')
     
     # Run scraping with enrollment details to trigger section clicking
     results = scraper.scrape_all_subjects(['CSCI'], get_details=True, get_enrollment_details=True, config=config)
     
     # Check what new debug files were created
-    debug_files_after = set(f for f in os.listdir('tests/output') if f.endswith('.html'))
+    debug_files_after = list_html_files('tests/output')
     new_files = debug_files_after - debug_files_before
     
     print(f'\n=== Debug Files Created ===')
     print(f'New HTML files: {len(new_files)}')
     
-    sections_files = [f for f in new_files if 'sections_' in f]
-    class_details_files = [f for f in new_files if 'class_details_' in f]
-    course_details_files = [f for f in new_files if f.startswith('course_details_')]
+    # Sort the new files into their categories in one pass
+    sections_files, class_details_files, course_details_files = [], [], []
+    for f in new_files:
+        if 'sections_' in f:
+            sections_files.append(f)
+        if 'class_details_' in f:
+            class_details_files.append(f)
+        if f.startswith('course_details_'):
+            course_details_files.append(f)
     
     print(f'- Course details files: {len(course_details_files)}')
     for f in course_details_files:
@@ -47,8 +58,8 @@ def test_debug_html_saving():
         print(f'  {f}')
     
     print(f'\n=== Results Summary ===')
-    if 'CSCI' in results and results['CSCI']:
-        course = results['CSCI'][0]
+    if csci_courses := results.get('CSCI'):
+        course = csci_courses[0]
         print(f'Course: {course.course_code} - {course.title}')
         print(f'Terms: {len(course.terms)}')
         
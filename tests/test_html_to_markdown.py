@@ -4,13 +4,19 @@ Test HTML to Markdown conversion with different libraries
 """
 
 import os
+import re
 import sys
+from functools import lru_cache
 
 # Add the parent directory to the path to import cuhk_scraper
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Blank (or whitespace-only) lines collapsed in the BeautifulSoup fallback output
+BLANK_LINES_PATTERN = re.compile(r'\n\s*\n')
+
+@lru_cache(maxsize=1)
 def read_test_html():
-    """Read the test HTML file"""
+    """Read the test HTML file (once - every converter test shares the same string)"""
     test_file = "tests/sample-webpages/Course Syllabus - List + Table.html"
     with open(test_file, 'r', encoding='utf-8') as f:
         return f.read()
@@ -125,8 +131,7 @@ def test_beautifulsoup_fallback():
         text = soup.get_text(separator='\n', strip=True)
         
         # Clean up excessive whitespace
-        import re
-        text = re.sub(r'\n\s*\n', '\n', text)
+        text = BLANK_LINES_PATTERN.sub('\n', text)
         
         print("✅ BeautifulSoup extraction successful")
         print("📝 Sample output (first 500 chars):")
@@ -9,46 +9,29 @@ import sys
 # Add the parent directory to the path to import cuhk_scraper
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from data_utils import EMPTY_TABLE_HEADER_PATTERN
+
 def read_markdownify_output():
     """Read the markdownify output file"""
     output_file = "tests/output/markdownify_output.md"
     with open(output_file, 'r', encoding='utf-8') as f:
         return f.read()
 
-def fix_table_headers(markdown_text):
+def fix_table_headers(markdown_text, debug=True):
     """Fix empty header rows in markdown tables"""
-    lines = markdown_text.split('\n')
-    result = []
-    
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        
-        # Detect empty header pattern: |  |  |
-        if line.strip().startswith('|') and line.strip().endswith('|'):
-            # Split by | and check if all cells are empty (ignoring first/last empty splits)
-            cells = line.split('|')[1:-1]  # Remove first and last empty elements
-            if all(cell.strip() == '' for cell in cells):
-                # Check if next line is separator: | --- | --- |
-                if i + 1 < len(lines) and '---' in lines[i + 1]:
-                    # Check if line after separator has content
-                    if i + 2 < len(lines) and lines[i + 2].strip().startswith('|'):
-                        print(f"🔧 Fixing empty header at line {i + 1}")
-                        print(f"   Empty header: {line.strip()}")
-                        print(f"   Separator: {lines[i + 1].strip()}")
-                        print(f"   Using as header: {lines[i + 2].strip()}")
-                        print()
-                        
-                        # Replace empty header with first data row
-                        result.append(lines[i + 2])  # Use first data row as header
-                        result.append(lines[i + 1])  # Keep separator
-                        i += 3  # Skip empty header, separator, and used data row
-                        continue
-        
-        result.append(line)
-        i += 1
+    def use_first_row_as_header(match):
+        if debug:
+            line_number = markdown_text.count('\n', 0, match.start()) + 1
+            print(f"🔧 Fixing empty header at line {line_number}")
+            print(f"   Empty header: {match['header'].strip()}")
+            print(f"   Separator: {match['separator'].strip()}")
+            print(f"   Using as header: {match['row'].strip()}")
+            print()
+        
+        # Replace empty header with first data row, keeping the separator
+        return f"{match['row']}\n{match['separator']}"
     
-    return '\n'.join(result)
+    return EMPTY_TABLE_HEADER_PATTERN.sub(use_first_row_as_header, markdown_text)
 
 def test_header_fix():
     """Test the header fix function"""
@@ -1,64 +1,132 @@
 import pytesseract
-from PIL import Image, ImageEnhance, ImageFilter
+from PIL import Image
+import numpy as np
+import cv2
 import os
+import tempfile
+from contextlib import contextmanager
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM  # Keeps one Tesseract instance (model loaded once)
+except ImportError:
+    PyTessBaseAPI = None  # Fall back to pytesseract (one tesseract subprocess per image)
+
+# Tesseract configuration for captcha-like text
+CHAR_WHITELIST = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+CUSTOM_CONFIG = f'--oem 3 --psm 8 -c tessedit_char_whitelist={CHAR_WHITELIST}'
+
+# PIL's ImageFilter.SHARPEN kernel (scale 16), applied with OpenCV
+SHARPEN_KERNEL = np.array([[-2, -2, -2],
+                           [-2, 32, -2],
+                           [-2, -2, -2]], dtype=np.float32) / 16
 
 def preprocess_image(image_path):
-    """Apply preprocessing to improve OCR accuracy"""
-    img = Image.open(image_path)
-    
+    """Apply preprocessing to improve OCR accuracy (returns a grayscale ndarray)"""
     # Convert to grayscale
-    img = img.convert('L')
+    img = np.asarray(Image.open(image_path).convert('L'), dtype=np.float32)
     
-    # Enhance contrast
-    enhancer = ImageEnhance.Contrast(img)
-    img = enhancer.enhance(2.0)
+    # Enhance contrast (same as ImageEnhance.Contrast(img).enhance(2.0): stretch around the mean)
+    mean = round(float(img.mean()))
+    img = np.clip((img - mean) * 2.0 + mean, 0, 255)
     
     # Apply slight sharpening
-    img = img.filter(ImageFilter.SHARPEN)
+    img = np.clip(cv2.filter2D(img, -1, SHARPEN_KERNEL), 0, 255).astype(np.uint8)
     
     # Scale up the image (makes OCR more accurate)
-    width, height = img.size
-    img = img.resize((width * 3, height * 3), Image.LANCZOS)
+    height, width = img.shape
+    img = cv2.resize(img, (width * 3, height * 3), interpolation=cv2.INTER_LANCZOS4)
     
     return img
 
+def read_texts_single_run(images):
+    """OCR several images with one tesseract process, passing it a file that lists the images"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        image_paths = []
+        for i, img in enumerate(images):
+            image_path = os.path.join(tmp_dir, f"image_{i}.png")
+            (img if isinstance(img, Image.Image) else Image.fromarray(img)).save(image_path)
+            image_paths.append(image_path)
+        
+        list_path = os.path.join(tmp_dir, "images.txt")
+        with open(list_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(image_paths) + '\n')
+        
+        output_base = os.path.join(tmp_dir, "output")
+        pytesseract.pytesseract.run_tesseract(list_path, output_base, extension='txt', lang=None, config=CUSTOM_CONFIG)
+        
+        # Tesseract ends every page with a form feed
+        with open(f"{output_base}.txt", encoding='utf-8') as f:
+            return f.read().split('\f')[:len(images)]
+
+@contextmanager
+def tesseract_reader():
+    """
+    Yield a function mapping a list of images to their OCR texts.
+    Uses a single Tesseract API when tesserocr is installed, otherwise one tesseract run for the whole batch.
+    """
+    if PyTessBaseAPI is None:
+        yield read_texts_single_run
+        return
+
+    # Same settings as CUSTOM_CONFIG: --oem 3 (default engine), --psm 8 (single word)
+    with PyTessBaseAPI(psm=PSM.SINGLE_WORD, oem=OEM.DEFAULT) as api:
+        api.SetVariable('tessedit_char_whitelist', CHAR_WHITELIST)
+
+        def read_texts(images):
+            texts = []
+            for img in images:
+                api.SetImage(img if isinstance(img, Image.Image) else Image.fromarray(img))
+                texts.append(api.GetUTF8Text())
+            return texts
+
+        yield read_texts
+
 def test_tesseract_captcha():
     captcha_files = [
         ('sample-webpages/sample_captcha_G6J1.png', 'G6J1'),
         ('sample-webpages/sample_captcha_PDG2.gif', 'PDG2')
     ]
     
-    # Tesseract configuration for captcha-like text
-    custom_config = r'--oem 3 --psm 8 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
-    
+    # Load and preprocess every captcha first so all OCR happens in one batch
+    samples = []  # (file_path, expected, original_img, processed_img)
     for file_path, expected in captcha_files:
         if os.path.exists(file_path):
-            print(f"\nTesting {file_path} (expected: {expected})")
-            
             try:
-                # Test with original image
-                original_img = Image.open(file_path)
-                original_text = pytesseract.image_to_string(original_img, config=custom_config).strip().upper()
-                print(f"Original image: '{original_text}'")
-                
-                # Test with preprocessed image
-                processed_img = preprocess_image(file_path)
-                processed_text = pytesseract.image_to_string(processed_img, config=custom_config).strip().upper()
-                print(f"Preprocessed: '{processed_text}'")
-                
-                print(f"Expected: '{expected}'")
-                print(f"Original match: {original_text == expected}")
-                print(f"Processed match: {processed_text == expected}")
-                
-                # Save preprocessed image for inspection
-                debug_path = f"debug_{os.path.basename(file_path)}"
-                processed_img.save(debug_path)
-                print(f"Saved preprocessed image: {debug_path}")
-                
+                samples.append((file_path, expected, Image.open(file_path), preprocess_image(file_path)))
             except Exception as e:
                 print(f"Error: {e}")
         else:
             print(f"File not found: {file_path}")
+    
+    if not samples:
+        return
+    
+    images = [img for _, _, original_img, processed_img in samples for img in (original_img, processed_img)]
+    try:
+        with tesseract_reader() as read_texts:
+            texts = [text.strip().upper() for text in read_texts(images)]
+    except Exception as e:
+        print(f"Error: {e}")
+        return
+    
+    # Tesseract can return fewer pages than images if a run was cut short
+    if len(texts) != len(images):
+        print(f"Error: got {len(texts)} OCR results for {len(images)} images")
+        return
+    
+    for i, (file_path, expected, _, processed_img) in enumerate(samples):
+        original_text, processed_text = texts[2 * i], texts[2 * i + 1]
+        print(f"\nTesting {file_path} (expected: {expected})")
+        print(f"Original image: '{original_text}'")
+        print(f"Preprocessed: '{processed_text}'")
+        
+        print(f"Expected: '{expected}'")
+        print(f"Original match: {original_text == expected}")
+        print(f"Processed match: {processed_text == expected}")
+        
+        # Save preprocessed image for inspection
+        debug_path = f"debug_{os.path.basename(file_path)}"
+        Image.fromarray(processed_img).save(debug_path)
+        print(f"Saved preprocessed image: {debug_path}")
 
 if __name__ == "__main__":
     test_tesseract_captcha()
\ No newline at end of file